@@ -8,7 +8,6 @@ Usage:
 """
 
 import argparse
-import subprocess
 import os
 import sys
 import time
@@ -16,6 +15,19 @@ import json
 from pathlib import Path
 from dotenv import load_dotenv
 
+# orjson is optional; fall back to the standard library json module without it
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 def check_dependencies():
     """Check if all required packages are installed and working properly."""
     missing_packages = []
@@ -109,8 +121,7 @@ def check_dependencies():
 def validate_data(file_path):
     """Validate that the JSON file has the expected structure."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _loads(Path(file_path).read_bytes())
             
         required_fields = ['id', 'name']
         for field in required_fields:
@@ -164,10 +175,9 @@ def merge_data_files(politician_name):
     data_objects = []
     for file_path in matching_files:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                data_objects.append(data)
-                print(f"Loaded {file_path.name}")
+            data = _loads(file_path.read_bytes())
+            data_objects.append(data)
+            print(f"Loaded {file_path.name}")
         except Exception as e:
             print(f"Error loading {file_path.name}: {str(e)}")
     
@@ -197,13 +207,19 @@ def merge_data_files(politician_name):
             if key not in merged_data and value:
                 merged_data[key] = value
     
+    # Files from different spiders often repeat the same text, so drop
+    # duplicates (keeping first-seen order) before anything embeds them
+    for key in ('speeches', 'statements'):
+        if merged_data.get(key):
+            merged_data[key] = list(dict.fromkeys(merged_data[key]))
+    
     # Create a clean output file with the politician's name
     output_filename = f"{simplified_name}.json"
     output_path = data_dir / output_filename
     
     # Save the merged data
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(merged_data, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(_dumps(merged_data))
         
     print(f"Merged data saved to {output_path}")
     
@@ -218,29 +234,43 @@ def merge_data_files(politician_name):
     
     return validate_data(output_path)
 
-def run_spider(spider_name, args, script_dir):
-    """Run a spider with proper error handling."""
+def run_spiders(spider_jobs):
+    """
+    Run the spiders in this process, concurrently in a single Twisted reactor.
+    spider_jobs is a list of (spider_name, spider_kwargs) tuples. Must be
+    called from the scraper directory so Scrapy finds scrapy.cfg.
+    """
     try:
-        # Use sys.executable to ensure we're using the same Python interpreter
-        cmd = [sys.executable, "-m", "scrapy", "crawl", spider_name] + args
-        print(f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, cwd=script_dir, capture_output=True, text=True)
-        
-        # Print the output
-        if result.stdout:
-            print(result.stdout)
+        from scrapy.crawler import CrawlerProcess
+        from scrapy.utils.project import get_project_settings
         
-        # Check for errors
-        if result.returncode != 0:
-            print(f"Error running {spider_name} spider:")
-            if result.stderr:
-                print(result.stderr)
-            return False
-        
-        return True
+        # One process means Scrapy and the project settings are loaded once;
+        # each crawler still builds its own pipeline, so the spaCy model is
+        # loaded once per spider
+        settings = get_project_settings()
+        # The spiders' logs now share this console instead of being captured
+        # from a subprocess, so show INFO and up rather than the project's DEBUG
+        settings.set('LOG_LEVEL', 'INFO', priority='cmdline')
+        process = CrawlerProcess(settings)
+        crawlers = []
+        for spider_name, spider_kwargs in spider_jobs:
+            print(f"Scheduling {spider_name} spider with {', '.join(spider_kwargs)}")
+            crawler = process.create_crawler(spider_name)
+            process.crawl(crawler, **spider_kwargs)
+            crawlers.append((spider_name, crawler))
+        process.start()
     except Exception as e:
-        print(f"Failed to run {spider_name} spider: {str(e)}")
+        print(f"Failed to run spiders: {str(e)}")
         return False
+    
+    # Each crawler records why it stopped; anything but "finished" is a failure
+    success = True
+    for spider_name, crawler in crawlers:
+        finish_reason = crawler.stats.get_value('finish_reason') if crawler.stats else None
+        if finish_reason != 'finished':
+            print(f"Error running {spider_name} spider: {finish_reason or 'did not start'}")
+            success = False
+    return success
 
 def main():
     parser = argparse.ArgumentParser(description="Political Data Scraper")
@@ -311,39 +341,40 @@ def main():
     
     print(f"Starting data collection for {args.politician}...")
     
-    # Run the Wikipedia spider
-    print("\n1. Running Wikipedia scraper...")
-    wiki_args = [
-        "-a", f"politician_name={args.politician}",
-        "-a", f"follow_links={args.follow_links}",
-        "-a", f"max_links={args.max_links}"
-    ]
-    success = run_spider("wikipedia_politician", wiki_args, script_dir)
+    # Wikipedia spider
+    spider_jobs = [("wikipedia_politician", {
+        "politician_name": args.politician,
+        "follow_links": args.follow_links,
+        "max_links": str(args.max_links),
+    })]
     
-    # Run the News API spider if not disabled
+    # News API spider if not disabled
     if not args.no_news:
-        print("\n2. Running News API scraper...")
-        news_args = ["-a", f"politician_name={args.politician}"]
+        news_kwargs = {"politician_name": args.politician}
         
         # Add API key if provided
         api_key = args.api_key or os.getenv('NEWS_API_KEY')
         if api_key:
             print("Using NewsAPI key for better results")
-            news_args.extend(["-a", f"api_key={api_key}"])
+            news_kwargs["api_key"] = api_key
         else:
             print("No NewsAPI key found. Will use limited access mode.")
         
         # Add max pages and time span
-        news_args.extend(["-a", f"max_pages={args.max_pages}"])
-        news_args.extend(["-a", f"time_span={args.time_span}"])
+        news_kwargs["max_pages"] = str(args.max_pages)
+        news_kwargs["time_span"] = str(args.time_span)
         
-        success = run_spider("news_api", news_args, script_dir) and success
+        spider_jobs.append(("news_api", news_kwargs))
+    
+    # Run the spiders
+    print("\n1. Running Wikipedia scraper" + ("" if args.no_news else " and News API scraper") + "...")
+    success = run_spiders(spider_jobs)
     
     # Allow time for any file operations to complete
     time.sleep(1)
     
     # Merge the data files if multiple files were created
-    print("\n3. Processing and merging data...")
+    print("\n2. Processing and merging data...")
     if merge_data_files(args.politician):
         print("\nData collection completed successfully!")
     else:
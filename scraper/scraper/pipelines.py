@@ -17,6 +17,16 @@ except ImportError:
     print("Warning: spaCy is not available. Text processing will be limited.")
     SPACY_AVAILABLE = False
 
+# orjson is optional; it serializes politician files much faster than json
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 class PoliticianPipeline:
     """Pipeline for processing and saving politician data"""
     
@@ -80,8 +90,8 @@ class PoliticianPipeline:
         filename = f"{item['id']}.json"
         filepath = self.data_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(dict(item), f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(dict(item)))
         
         print(f"Saving to: {filepath}")
         spider.logger.info(f"Saved politician data to {filepath}")
@@ -1,9 +1,16 @@
 import scrapy
 import re
 import urllib.parse
+from lxml import etree
+from lxml.html import fragment_fromstring
 from scrapy.exceptions import CloseSpider
 from ..items import PoliticianItem
 
+# Compiled once and shared by every clean_html call
+_TAG_RE = re.compile(r'<[^>]+>')
+_CITE_RE = re.compile(r'\[\d+\]')
+_WS_RE = re.compile(r'\s+')
+
 class WikipediaPoliticianSpider(scrapy.Spider):
     name = "wikipedia_politician"
     allowed_domains = ["en.wikipedia.org"]
@@ -287,13 +294,19 @@ class WikipediaPoliticianSpider(scrapy.Spider):
         if not html_text:
             return ""
             
-        # Basic HTML tag removal (in a real implementation, use a proper HTML parser)
-        text = re.sub(r'<[^>]+>', ' ', html_text)
+        # Parse the fragment once with lxml (installed with Scrapy), which also
+        # decodes entities; joining text nodes with spaces keeps words from
+        # adjacent elements apart. Fall back to regex tag removal if it fails.
+        try:
+            fragment = fragment_fromstring(html_text, create_parent='div')
+            text = ' '.join(fragment.itertext())
+        except (etree.ParserError, ValueError):
+            text = _TAG_RE.sub(' ', html_text)
         
         # Remove citation brackets like [1], [2], etc.
-        text = re.sub(r'\[\d+\]', '', text)
+        text = _CITE_RE.sub('', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         return text.strip() 
\ No newline at end of file
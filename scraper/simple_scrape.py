@@ -5,73 +5,248 @@ This version doesn't require spaCy or other advanced dependencies.
 
 Usage:
     python simple_scrape.py --politician "Politician Name"
+    python simple_scrape.py --politician "First Name" "Second Name"
+    python simple_scrape.py --politicians-file names.txt [--concurrency 8]
 """
 
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import hashlib
+import threading
+import time
 import re
 import datetime
+import itertools
+from functools import lru_cache
 import os
 import sys
 from pathlib import Path
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+# selectolax and lxml are optional HTML parsers; fall back to regex tag
+# stripping when neither is installed
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from lxml import etree
+    from lxml.html import fragment_fromstring
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# re2 is optional; when installed, patterns that scan raw HTML run on its
+# linear-time engine instead of the backtracking re module
+try:
+    import re2 as _html_re
+except ImportError:
+    _html_re = re
+
+# Patterns are compiled once at import and reused for every politician
+_TAG_RE = _html_re.compile(r'<[^>]+>')
+_CITE_RE = re.compile(r'\[\d+\]')
+_WS_RE = re.compile(r'\s+')
+# Infobox wikitext: the "| party = ..." value runs until the next parameter
+_PARTY_RE = re.compile(r'^\s*\|\s*party\s*=(.*?)(?=^\s*\||^\}\}|\Z)', re.MULTILINE | re.DOTALL)
+_REF_RE = re.compile(r'<ref[^>]*/>|<ref[^>]*>.*?</ref>', re.DOTALL)
+_LINK_RE = re.compile(r'\[\[(?:[^\]|]*\|)?([^\]]*)\]\]')
+_TEMPLATE_OPEN_RE = re.compile(r'\{\{[^{}|]*\|?')
+_WIKI_MARKUP_RE = re.compile(r"\}\}|'{2,}|^\s*\*", re.MULTILINE)
+_QUOTE_RE = re.compile(r'"([^"]{10,})"')
+_SLUG_RE = re.compile(r'[^a-z0-9-]')
+
+# orjson is optional; it serializes politician files much faster than json
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+# Shared session so every Wikipedia API call reuses the same keep-alive
+# connection and advertises gzip
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept-Encoding": "gzip",
+    "User-Agent": "aipolitician-data/1.0"
+})
+
+def _mount_adapter(pool_size):
+    """Size the session's connection pool and retry transient API failures"""
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    _SESSION.mount('https://', adapter)
+
+_mount_adapter(10)
+
+# Maximum number of quoted statements kept per politician
+MAX_STATEMENTS = 5
+
+# Scraped politician files are written to the project's data directory
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+class HttpCache:
+    """
+    On-disk cache of Wikipedia API responses. Responses younger than `ttl`
+    seconds are served without touching the network; older ones are
+    revalidated with conditional GETs using their ETag/Last-Modified.
+    """
+    
+    def __init__(self, cache_dir, ttl=86400):
+        self.cache_dir = Path(cache_dir)
+        self.index_path = self.cache_dir / 'index.json'
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = {}
+        
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable HTTP cache index: {str(e)}")
+    
+    def _read_body(self, entry):
+        """Load a cached response body, or None if it is missing or corrupt"""
+        try:
+            with open(self.cache_dir / entry['body_path'], 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def get_json(self, url):
+        """GET a JSON URL, serving fresh cache hits locally and revalidating stale ones"""
+        entry = self.entries.get(url)
+        headers = {}
+        if entry:
+            if self.ttl > 0 and time.time() - entry.get('fetched_at', 0) < self.ttl:
+                data = self._read_body(entry)
+                if data is not None:
+                    print(f"Using cached response for: {url}")
+                    return data
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = _SESSION.get(url, headers=headers, timeout=10)
+        
+        if response.status_code == 304 and entry:
+            data = self._read_body(entry)
+            if data is not None:
+                print(f"Not modified, using cached response for: {url}")
+                with self.lock:
+                    entry['fetched_at'] = time.time()
+                return data
+            # Cached body is gone, so fetch the full response again
+            response = _SESSION.get(url, timeout=10)
+        
+        response.raise_for_status()
+        data = response.json()
+        
+        body_path = hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json'
+        with self.lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / body_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            self.entries[url] = {
+                "etag": response.headers.get('ETag'),
+                "last_modified": response.headers.get('Last-Modified'),
+                "fetched_at": time.time(),
+                "body_path": body_path
+            }
+        
+        return data
+    
+    def save(self):
+        """Write the validator index next to the cached bodies"""
+        if not self.entries:
+            return
+        with self.lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+
+_HTTP_CACHE = HttpCache(DATA_DIR / '.http_cache')
 
 def clean_html(html_text):
     """Simple function to remove HTML tags and clean text"""
     if not html_text:
         return ""
         
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', html_text)
+    text = None
+    if SELECTOLAX_AVAILABLE:
+        # Parse once with the C-backed parser, which also decodes entities
+        text = HTMLParser(html_text).text(separator=' ', strip=True)
+    elif LXML_AVAILABLE:
+        try:
+            fragment = fragment_fromstring(html_text, create_parent='div')
+            text = ' '.join(fragment.itertext())
+        except (etree.ParserError, ValueError):
+            pass
+    
+    if text is None:
+        # Remove HTML tags
+        text = _TAG_RE.sub(' ', html_text)
     
     # Remove citation brackets like [1], [2], etc.
-    text = re.sub(r'\[\d+\]', '', text)
+    text = _CITE_RE.sub('', text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     return text.strip()
 
+def extract_political_affiliation(wikitext):
+    """Find the party parameter of an infobox in wikitext and return its plain text"""
+    party_match = _PARTY_RE.search(wikitext)
+    if not party_match:
+        return ''
+    
+    text = _REF_RE.sub('', party_match.group(1))
+    # [[Target|Label]] -> Label, [[Target]] -> Target
+    text = _LINK_RE.sub(r'\1', text)
+    # Unwrap layout templates such as {{nowrap|...}} and {{plainlist|...}}
+    text = _TEMPLATE_OPEN_RE.sub(' ', text)
+    text = _WIKI_MARKUP_RE.sub(' ', text)
+    # Strip any inline HTML such as <br />
+    return clean_html(text)
+
+def iter_unique_quotes(text):
+    """Lazily yield distinct quoted passages from text in order of appearance"""
+    seen = set()
+    for match in _QUOTE_RE.finditer(text):
+        quote = match.group(1).strip()
+        if quote and quote not in seen:
+            seen.add(quote)
+            yield quote
+
 def scrape_wikipedia(politician_name):
     """Scrape basic information about a politician from Wikipedia"""
     print(f"Searching Wikipedia for: {politician_name}")
     
-    # Format the name for URL
-    query = urllib.parse.quote(politician_name)
-    search_url = f"https://en.wikipedia.org/w/api.php?action=opensearch&search={query}&limit=1&format=json"
+    # Search for the page and fetch its intro extract and lead-section wikitext
+    # (which holds the infobox) in a single API call
+    query = _quote_name(politician_name)
+    api_url = f"https://en.wikipedia.org/w/api.php?action=query&generator=search&gsrsearch={query}&gsrlimit=1&prop=extracts|info|revisions&exintro=1&explaintext=1&inprop=url&rvprop=content&rvsection=0&rvslots=main&format=json"
     
     try:
-        # Search for the politician
-        print(f"Requesting search results from: {search_url}")
-        search_response = requests.get(search_url)
-        search_data = search_response.json()
-        
-        print(f"Search response: {search_data}")
-        
-        if not search_data[3] or len(search_data[3]) == 0:
-            print(f"No Wikipedia page found for {politician_name}")
-            return None
-            
-        # Get the first result URL
-        page_url = search_data[3][0]
-        print(f"Found Wikipedia page: {page_url}")
-        
-        # Get the page title from the URL
-        page_title = page_url.split('/')[-1].replace('_', ' ')
-        print(f"Page title: {page_title}")
-        
-        # Get the content of the page using the Wikipedia API
-        api_url = f"https://en.wikipedia.org/w/api.php?action=query&prop=extracts|pageimages|info&exintro=1&inprop=url&titles={urllib.parse.quote(page_title)}&format=json&explaintext=1"
         print(f"Requesting page content from: {api_url}")
-        
-        content_response = requests.get(api_url)
-        content_data = content_response.json()
+        content_data = _HTTP_CACHE.get_json(api_url)
         
         # Extract the page content
-        pages = content_data['query']['pages']
+        pages = content_data.get('query', {}).get('pages')
         if not pages:
-            print("No page content found")
+            print(f"No Wikipedia page found for {politician_name}")
             return None
             
         page_id = list(pages.keys())[0]
@@ -79,34 +254,26 @@ def scrape_wikipedia(politician_name):
         
         # Check if page exists
         if 'missing' in page_info:
-            print(f"Page {page_title} does not exist")
+            print(f"No Wikipedia page found for {politician_name}")
             return None
             
         # Extract basic information
+        page_title = page_info.get('title', politician_name)
         raw_content = page_info.get('extract', '')
-        full_url = page_info.get('fullurl', page_url)
+        full_url = page_info.get('fullurl', '')
         
+        print(f"Found Wikipedia page: {full_url}")
+        print(f"Page title: {page_title}")
         print(f"Retrieved {len(raw_content)} characters of content")
         
-        # Try to find political party affiliation using another API call
-        party_url = f"https://en.wikipedia.org/w/api.php?action=parse&page={urllib.parse.quote(page_title)}&prop=text&section=0&format=json"
-        print(f"Requesting infobox from: {party_url}")
-        
+        # Extract political party from the infobox if it exists
         try:
-            party_response = requests.get(party_url)
-            party_data = party_response.json()
-            
-            # Extract political party from infobox if it exists
-            if 'parse' in party_data and 'text' in party_data['parse']:
-                html_content = party_data['parse']['text']['*']
+            revisions = page_info.get('revisions', [])
+            if revisions:
+                wikitext = revisions[0]['slots']['main']['*']
+                political_affiliation = extract_political_affiliation(wikitext)
                 
-                # Look for political party in the infobox
-                party_match = re.search(r'Political party</th[^>]*><td[^>]*>(.*?)</td>', html_content)
-                political_affiliation = ''
-                
-                if party_match:
-                    # Clean up HTML tags
-                    political_affiliation = clean_html(party_match.group(1))
+                if political_affiliation:
                     print(f"Found political affiliation: {political_affiliation}")
                 else:
                     print("Political affiliation not found in infobox")
@@ -131,35 +298,49 @@ def scrape_wikipedia(politician_name):
         
         # Try to extract some statements from the content
         # This is a very simple approach - just looking for quoted text
-        quote_pattern = re.compile(r'"([^"]{10,})"')
-        quotes = quote_pattern.findall(raw_content)
+        # Stop scanning as soon as enough distinct quotes have been found
+        quotes = list(itertools.islice(iter_unique_quotes(raw_content), MAX_STATEMENTS))
         
         if quotes:
-            politician_data["statements"] = quotes[:5]  # Take up to 5 quotes
-            print(f"Found {len(quotes)} potential statements/quotes")
+            politician_data["statements"] = quotes
+            print(f"Found {len(quotes)} statements/quotes")
         
         return politician_data
     except Exception as e:
         print(f"Error scraping Wikipedia: {str(e)}")
         return None
 
+def scrape_politicians(politician_names, max_workers=8):
+    """Scrape several politicians concurrently, returning a dict keyed by name"""
+    # Scraping is network-bound, so threads sharing the pooled session overlap
+    # the round trips; max_workers bounds the load placed on Wikipedia
+    if len(politician_names) == 1:
+        return {politician_names[0]: scrape_wikipedia(politician_names[0])}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(scrape_wikipedia, politician_names)
+        return dict(zip(politician_names, results))
+
+@lru_cache(maxsize=4096)
+def _slug(name):
+    """Lowercase, hyphenate and strip special characters from a name"""
+    return _SLUG_RE.sub('', name.lower().replace(' ', '-'))
+
+@lru_cache(maxsize=4096)
+def _quote_name(name):
+    """URL-quote a name for the Wikipedia search query"""
+    return urllib.parse.quote(name)
+
 def generate_id_from_name(name):
     """Generate a URL-friendly ID from the politician's name"""
-    # Convert to lowercase and replace spaces with hyphens
-    name_id = name.lower().replace(' ', '-')
-    
-    # Remove special characters
-    name_id = re.sub(r'[^a-z0-9-]', '', name_id)
-    
     # Add timestamp to ensure uniqueness
-    timestamp = datetime.datetime.now().strftime("%Y%m%d")
-    return f"{name_id}-{timestamp}"
+    timestamp = datetime.date.today().strftime("%Y%m%d")
+    return f"{_slug(name)}-{timestamp}"
 
 def save_data(data, politician_name):
     """Save the politician data to a JSON file"""
-    # Get the project root directory and create data directory if needed
-    root_dir = Path(__file__).resolve().parent.parent
-    data_dir = root_dir / 'data'
+    # Create data directory if needed
+    data_dir = DATA_DIR
     data_dir.mkdir(exist_ok=True)
     
     # Create a filename based on the politician's name
@@ -168,22 +349,44 @@ def save_data(data, politician_name):
     filepath = data_dir / filename
     
     # Save the data to a file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(_dumps(data))
         
     print(f"Saved politician data to {filepath}")
     return filepath
 
+def read_politician_names(file_path):
+    """Read politician names from a file, one per line, skipping blanks and # comments"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        names = [line.strip() for line in f]
+    # dict.fromkeys drops repeated names while keeping file order
+    return list(dict.fromkeys(name for name in names if name and not name.startswith('#')))
+
 def main():
     parser = argparse.ArgumentParser(description="Simple Political Data Scraper")
-    parser.add_argument('--politician', type=str, required=True, 
-                        help="Name of the politician to scrape data for")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--politician', type=str, nargs='+', 
+                        help="Name(s) of the politician(s) to scrape data for")
+    source.add_argument('--politicians-file', type=str,
+                        help="File with one politician name per line to scrape in batch")
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help="Maximum number of politicians scraped at once (default: 8)")
+    parser.add_argument('--cache-ttl', type=int, default=86400,
+                        help="Seconds a cached Wikipedia response is reused without revalidating (default: 86400, 0 always revalidates)")
     parser.add_argument('--verbose', '-v', action='store_true',
                         help="Show more detailed output")
     
     args = parser.parse_args()
     
-    print(f"Starting simple data collection for {args.politician}...")
+    if args.politicians_file:
+        politician_names = read_politician_names(args.politicians_file)
+        if not politician_names:
+            print(f"Error: No politician names found in {args.politicians_file}")
+            sys.exit(1)
+    else:
+        politician_names = args.politician
+    
+    print(f"Starting simple data collection for {', '.join(politician_names)}...")
     
     # Check for requests module
     try:
@@ -193,18 +396,26 @@ def main():
         print("Please install it using: pip install requests")
         sys.exit(1)
     
+    _HTTP_CACHE.ttl = args.cache_ttl
+    
+    # Keep one pooled connection per concurrent worker
+    if args.concurrency > 10:
+        _mount_adapter(args.concurrency)
+    
     # Scrape Wikipedia
-    politician_data = scrape_wikipedia(args.politician)
-    
-    if politician_data:
-        # Save the data
-        save_data(politician_data, args.politician)
-        print("\nData collection completed successfully!")
-        print(f"Fields collected: {', '.join(politician_data.keys())}")
-        print(f"Content length: {len(politician_data.get('raw_content', ''))} characters")
-        print(f"Statements found: {len(politician_data.get('statements', []))}")
-    else:
-        print("\nData collection failed. No information could be retrieved.")
+    results = scrape_politicians(politician_names, max_workers=args.concurrency)
+    _HTTP_CACHE.save()
+    
+    for politician_name, politician_data in results.items():
+        if politician_data:
+            # Save the data
+            save_data(politician_data, politician_name)
+            print(f"\nData collection completed successfully for {politician_name}!")
+            print(f"Fields collected: {', '.join(politician_data.keys())}")
+            print(f"Content length: {len(politician_data.get('raw_content', ''))} characters")
+            print(f"Statements found: {len(politician_data.get('statements', []))}")
+        else:
+            print(f"\nData collection failed for {politician_name}. No information could be retrieved.")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,6 +4,7 @@ This ensures consistency across all scripts.
 """
 
 import os
+import sqlite3
 import sys
 import chromadb
 from chromadb.config import Settings
@@ -11,6 +12,27 @@ from chromadb.config import Settings
 # Database directory path - centralized configuration
 DB_DIR = "/opt/chroma_db"
 
+# Optional Chroma server; when CHROMA_HOST is set, ingestion talks to the
+# server over HTTP instead of opening DB_DIR directly
+CHROMA_HOST = os.environ.get("CHROMA_HOST")
+CHROMA_PORT = int(os.environ.get("CHROMA_PORT", "8000"))
+
+# Collection shared by the setup, ingest and query scripts
+COLLECTION_NAME = "politicians"
+
+# HNSW index settings, applied when the collection is first created.
+# A denser graph (M) and wider construction/search beams trade some insert
+# time for recall. Larger batch/sync sizes let Chroma update and persist the
+# index in bulk instead of after every small add.
+COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+    "hnsw:batch_size": 10000,
+    "hnsw:sync_threshold": 20000,
+}
+
 def check_directory_access(directory, need_write=True):
     """Check if the directory exists and has proper permissions."""
     # Check if directory exists
@@ -41,8 +63,37 @@ def check_directory_access(directory, need_write=True):
     
     return True
 
+def enable_sqlite_wal(db_dir=DB_DIR):
+    """
+    Switch Chroma's SQLite database to write-ahead logging.
+    WAL mode is stored in the database file itself, so setting it once from
+    a separate connection also applies to the connections Chroma opens.
+    """
+    db_path = os.path.join(db_dir, "chroma.sqlite3")
+    if not os.path.exists(db_path):
+        return
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Warning: could not enable WAL mode on {db_path}: {e}")
+
+# Client shared by every caller in this process; see get_chroma_client
+_client = None
+
 def get_chroma_client():
-    """Get a consistent Chroma client with proper error handling."""
+    """
+    Get a consistent Chroma client with proper error handling.
+    The client is created once per process and reused, so scripts that call
+    each other's main() (or a driver looping over many files) share one
+    SQLite connection pool and one loaded HNSW index.
+    """
+    global _client
+    if _client is not None:
+        return _client
     try:
         # Check directory permissions first
         if not check_directory_access(DB_DIR):
@@ -56,11 +107,43 @@ def get_chroma_client():
             )
         )
         
+        # WAL lets bulk inserts commit without rewriting the rollback journal
+        enable_sqlite_wal()
+        
+        _client = client
         return client
     except Exception as e:
         print(f"Error creating Chroma client: {str(e)}")
         sys.exit(1)
 
+async def get_async_chroma_client():
+    """Get an async HTTP client for the Chroma server at CHROMA_HOST:CHROMA_PORT."""
+    try:
+        return await chromadb.AsyncHttpClient(
+            host=CHROMA_HOST,
+            port=CHROMA_PORT,
+            settings=Settings(
+                anonymized_telemetry=False
+            )
+        )
+    except Exception as e:
+        print(f"Error connecting to Chroma server at {CHROMA_HOST}:{CHROMA_PORT}: {str(e)}")
+        sys.exit(1)
+
+def get_politicians_collection(client):
+    """Get or create the politicians collection with the shared index settings."""
+    return client.get_or_create_collection(
+        COLLECTION_NAME,
+        metadata=COLLECTION_METADATA
+    )
+
+async def get_politicians_collection_async(client):
+    """Async counterpart of get_politicians_collection for AsyncHttpClient."""
+    return await client.get_or_create_collection(
+        COLLECTION_NAME,
+        metadata=COLLECTION_METADATA
+    )
+
 def print_collections(client):
     """Print all available collections."""
     try:
@@ -3,6 +3,7 @@ Diagnostic script for Chroma database.
 This script performs various checks to help troubleshoot issues with the Chroma database.
 """
 
+import argparse
 import os
 import sys
 import shutil
@@ -30,16 +31,43 @@ def check_db_files():
     
     return True
 
-def reset_db():
-    """Reset the database by removing all files."""
-    response = input(f"Do you want to reset the database at {DB_DIR}? (yes/no): ")
-    if response.lower() == "yes":
+def snapshot_dir(src, dst):
+    """
+    Snapshot a directory tree using hardlinks, so the backup costs one
+    metadata operation per file instead of copying every byte.
+    Falls back to a regular copy where hardlinks are not possible
+    (e.g. across filesystems).
+    """
+    for root, dirs, files in os.walk(src):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            source = os.path.join(root, name)
+            target = os.path.join(target_root, name)
+            if os.path.lexists(target):
+                os.remove(target)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+def reset_db(confirm=False):
+    """
+    Reset the database by removing all files.
+    Prompts for confirmation unless confirm is True.
+    """
+    if not confirm:
+        response = input(f"Do you want to reset the database at {DB_DIR}? (yes/no): ")
+        confirm = response.lower() == "yes"
+    if confirm:
         try:
             # Save a backup first
             if os.path.exists(DB_DIR):
                 backup_dir = f"{DB_DIR}_backup"
                 print(f"Creating backup at {backup_dir}")
-                shutil.copytree(DB_DIR, backup_dir, dirs_exist_ok=True)
+                # Hardlinks are safe here: the originals are unlinked right
+                # below, so nothing writes through to the backup afterwards
+                snapshot_dir(DB_DIR, backup_dir)
             
             # Clear the directory
             if os.path.exists(DB_DIR):
@@ -93,6 +121,16 @@ def test_collection_creation():
         return False
 
 def main():
+    parser = argparse.ArgumentParser(description='Diagnose the Chroma database')
+    reset_group = parser.add_mutually_exclusive_group()
+    reset_group.add_argument('--yes', action='store_true',
+                             help='Reset the database without prompting if issues are found '
+                                  '(also enabled by CHROMA_RESET=1)')
+    reset_group.add_argument('--no', action='store_true',
+                             help='Never reset the database and never prompt')
+    args = parser.parse_args()
+    auto_reset = args.yes or (not args.no and os.environ.get("CHROMA_RESET") == "1")
+    
     print("=== Chroma Database Diagnostic ===")
     
     # Check directory permissions
@@ -123,7 +161,10 @@ def main():
     # Offer to reset the database if there are issues
     if not db_files_exist or not collection_test:
         print("\n5. Database issues detected. You might want to reset the database.")
-        reset_db()
+        if args.no:
+            print("Skipping database reset (--no)")
+        else:
+            reset_db(confirm=auto_reset)
     else:
         print("\n5. No critical issues detected.")
     
@@ -0,0 +1,146 @@
+"""
+Embedding cache used during ingestion.
+Documents are embedded with Chroma's default model (the one Chroma would run
+inside collection.add, on the GPU when available), and the vectors are kept in a
+local SQLite file keyed by the SHA-256 of the text, so re-ingesting unchanged
+text does not run the model again.
+"""
+
+import hashlib
+import importlib.util
+import os
+import sqlite3
+import numpy as np
+from chromadb.utils import embedding_functions
+
+# sentence-transformers is optional; with it and a CUDA device, batches are
+# embedded on the GPU instead of by Chroma's CPU ONNX runtime. It (and torch)
+# is only imported once something actually has to be embedded.
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+# Location of the cache file; override with EMBED_CACHE_PATH
+EMBED_CACHE_PATH = os.environ.get(
+    "EMBED_CACHE_PATH",
+    os.path.expanduser("~/.cache/politician_embed.db")
+)
+
+# Chroma's default embedding model, so GPU vectors match the ones Chroma
+# computes for query_texts
+EMBED_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Texts per forward pass when embedding on the GPU
+EMBED_BATCH_SIZE = 64
+
+# Vectors are stored as float16, half the size of float32; for normalized
+# MiniLM vectors the rounding does not change nearest-neighbour results in
+# practice. Chroma itself still receives (and stores) float32.
+CACHE_DTYPE = np.float16
+CACHE_TABLE = "embeddings_fp16"
+
+# SQLite limits the number of bound parameters per statement
+LOOKUP_CHUNK_SIZE = 500
+
+def text_hash(text):
+    """Return the hex SHA-256 of a document's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class SentenceTransformerEmbedder:
+    """Embed a whole batch with sentence-transformers in EMBED_BATCH_SIZE passes."""
+    def __init__(self, device="cuda"):
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(EMBED_MODEL_NAME, device=device)
+        # Half precision roughly doubles GPU throughput; the cache keeps
+        # float16 vectors anyway, so nothing is lost downstream
+        if device == "cuda":
+            self.model.half()
+
+    def __call__(self, input):
+        return self.model.encode(
+            list(input),
+            batch_size=EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
+def default_embedding_function():
+    """Use the GPU when sentence-transformers and CUDA are available, else Chroma's default."""
+    if SENTENCE_TRANSFORMERS_AVAILABLE:
+        import torch
+        if torch.cuda.is_available():
+            return SentenceTransformerEmbedder(device="cuda")
+    return embedding_functions.DefaultEmbeddingFunction()
+
+class EmbeddingCache:
+    """
+    Look up embeddings by text hash and compute the missing ones in a single
+    call to the embedding function.
+    """
+    def __init__(self, path=EMBED_CACHE_PATH, embedding_function=None):
+        # A bare filename (EMBED_CACHE_PATH=emb.db) has no directory to create
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Server-mode ingest embeds on a worker thread; it is the only thread
+        # using the connection until close()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (hash TEXT PRIMARY KEY, vector BLOB)"
+        )
+        self._embedding_function = embedding_function
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def embedding_function(self):
+        """Created on the first cache miss, so a fully cached run never loads the model."""
+        if self._embedding_function is None:
+            self._embedding_function = default_embedding_function()
+        return self._embedding_function
+
+    def _lookup(self, hashes):
+        """Return {hash: vector} for the hashes already in the cache."""
+        found = {}
+        for i in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+            chunk = hashes[i:i + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT hash, vector FROM {CACHE_TABLE} WHERE hash IN ({placeholders})",
+                chunk
+            )
+            found.update((h, np.frombuffer(v, dtype=CACHE_DTYPE)) for h, v in rows)
+        return found
+
+    def embed(self, documents):
+        """Return one embedding (a list of floats) per document."""
+        hashes = [text_hash(document) for document in documents]
+        vectors = self._lookup(list(dict.fromkeys(hashes)))
+
+        # Embed each missing text once, even if it repeats within the batch
+        missing = {}
+        for h, document in zip(hashes, documents):
+            if h not in vectors:
+                missing.setdefault(h, document)
+        miss_count = sum(1 for h in hashes if h in missing)
+        self.misses += miss_count
+        self.hits += len(hashes) - miss_count
+
+        if missing:
+            # Embed in order of length so each model batch holds texts of
+            # similar size and little of it is spent on padding; vectors are
+            # matched back to documents by hash, so no un-sorting is needed
+            order = sorted(missing, key=lambda h: len(missing[h]))
+            computed = self.embedding_function([missing[h] for h in order])
+            # Round fresh vectors to the cached precision too, so a document
+            # gets the same vector whether or not it was a cache hit
+            new_vectors = {h: np.asarray(v, dtype=CACHE_DTYPE) for h, v in zip(order, computed)}
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {CACHE_TABLE} (hash, vector) VALUES (?, ?)",
+                    [(h, v.tobytes()) for h, v in new_vectors.items()]
+                )
+            vectors.update(new_vectors)
+
+        return [vectors[h].astype(np.float32).tolist() for h in hashes]
+
+    def close(self):
+        self.conn.close()
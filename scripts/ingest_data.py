@@ -1,20 +1,74 @@
 # scripts/ingest_data.py
+import asyncio
 import json
+import mmap
 import os
 import sys
-from chroma_config import get_chroma_client, print_collections, DB_DIR
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from chroma_config import (
+    get_chroma_client, get_async_chroma_client, get_politicians_collection,
+    get_politicians_collection_async, print_collections, DB_DIR, CHROMA_HOST, CHROMA_PORT
+)
+from embedding_cache import EmbeddingCache, EMBED_CACHE_PATH
+
+# orjson is optional; fall back to the standard library parser without it
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
 
 # Get the script's directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Get the project root directory (parent of scripts)
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 
-# Default data file path - will be overridden by command line argument if provided
+# Default data file path - will be overridden by command line arguments if provided.
+# Arguments may be JSON files or directories, which are expanded to their *.json files.
 DEFAULT_DATA_FILE = os.path.join(PROJECT_ROOT, "data", "sample_politician.json")
 
-def ingest_politician(entry: dict, collection):
+# Files at least this large are parsed from a memory map instead of being
+# read into a bytes object first (orjson only; json.loads needs bytes)
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Print a progress line after this many files instead of one line per file
+PROGRESS_EVERY = 100
+
+# Worker threads used to read and prepare politician files
+MAX_LOAD_WORKERS = 16
+
+# Documents per collection.add call when ingesting several files; batches of
+# a few hundred keep Chroma's per-call overhead low without very large requests
+MAX_BATCH_SIZE = 250
+
+# A document whose embedding has at least this cosine similarity to an
+# earlier document of the same politician and type (repeated boilerplate,
+# near-identical quotes) is skipped rather than indexed again. Set to None
+# to keep every document.
+NEAR_DUPLICATE_THRESHOLD = 0.95
+
+# Batches allowed in flight at once against a Chroma server
+MAX_INFLIGHT_ADDS = 8
+
+# raw_content is split into overlapping windows (in characters), each with
+# its own vector. all-MiniLM-L6-v2 truncates input at 256 word pieces, so
+# ~1000 characters (roughly 200-250 tokens of English) keeps a whole chunk
+# inside the model's window instead of silently dropping its tail.
+RAW_CHUNK_SIZE = 1000
+RAW_CHUNK_OVERLAP = 100
+
+def chunk_text(text, size=RAW_CHUNK_SIZE, overlap=RAW_CHUNK_OVERLAP):
+    """Split text into overlapping chunks of at most `size` characters."""
+    step = size - overlap
+    return [text[i:i + size] for i in range(0, max(len(text) - overlap, 1), step)]
+
+def prepare_politician_docs(entry: dict):
     """
-    Store each relevant piece of text as a separate document.
+    Build the parallel documents, ids and metadatas lists for one politician,
+    storing each relevant piece of text as a separate document.
     """
     politician_id = entry["id"]
     
@@ -27,92 +81,493 @@ def ingest_politician(entry: dict, collection):
         # ... any other universal fields
     }
 
+    # Source fields are the same for every doc of this politician, so each type
+    # gets one metadata template; Chroma only reads these, so speeches and
+    # statements can share a single dict per type
+    base_metadata["source_url"] = entry.get("source_url", "")   # or store a list if multiple
+    base_metadata["timestamp"] = entry.get("timestamp", "")
+    raw_meta = {**base_metadata, "type": "raw_content"}
+    speech_meta = {**base_metadata, "type": "speech"}
+    statement_meta = {**base_metadata, "type": "statement"}
+
+    documents, ids, metadatas = [], [], []
+
     # 1) raw_content
     if "raw_content" in entry and entry["raw_content"]:
-        collection.add(
-            documents=[entry["raw_content"]],
-            ids=[f"{politician_id}_raw"],
-            metadatas=[{
-                **base_metadata,
-                "type": "raw_content",
-                "source_url": entry.get("source_url", ""),   # or store a list if multiple
-                "timestamp": entry.get("timestamp", "")
-            }]
-        )
+        raw_prefix = politician_id + "_raw_"
+        for idx, chunk in enumerate(chunk_text(entry["raw_content"])):
+            documents.append(chunk)
+            ids.append(raw_prefix + str(idx))
+            # Each chunk records its own index, so it needs its own dict
+            metadatas.append({**raw_meta, "chunk": idx})
 
     # 2) speeches
+    # If each speech came from a different URL, store that logic separately.
     speeches = entry.get("speeches", [])
-    for idx, speech_text in enumerate(speeches):
-        doc_id = f"{politician_id}_speech_{idx}"
-        metadata = {
-            **base_metadata,
-            "type": "speech",
-            "source_url": entry.get("source_url", ""),
-            "timestamp": entry.get("timestamp", "")
-        }
-        # If each speech came from a different URL, store that logic separately.
-        
-        collection.add(
-            documents=[speech_text],
-            ids=[doc_id],
-            metadatas=[metadata]
-        )
+    documents.extend(speeches)
+    speech_prefix = politician_id + "_speech_"
+    ids.extend(speech_prefix + str(idx) for idx in range(len(speeches)))
+    metadatas.extend([speech_meta] * len(speeches))
 
     # 3) statements
     statements = entry.get("statements", [])
-    for idx, statement_text in enumerate(statements):
-        doc_id = f"{politician_id}_statement_{idx}"
-        metadata = {
-            **base_metadata,
-            "type": "statement",
-            "source_url": entry.get("source_url", ""),
-            "timestamp": entry.get("timestamp", "")
-        }
-        
-        collection.add(
-            documents=[statement_text],
-            ids=[doc_id],
-            metadatas=[metadata]
-        )
+    documents.extend(statements)
+    statement_prefix = politician_id + "_statement_"
+    ids.extend(statement_prefix + str(idx) for idx in range(len(statements)))
+    metadatas.extend([statement_meta] * len(statements))
 
     # Similarly for sponsored_bills, voting_record, etc., if you want them as text docs:
     # ...
-    
-def main():
+
+    # Documents are embedded (and hashed for the cache) before they reach
+    # add_documents, so a non-string one would fail its whole batch there;
+    # reject the file instead (see FILE_ERRORS)
+    for doc_id, document in zip(ids, documents):
+        if not isinstance(document, str):
+            raise TypeError(f"{doc_id} is not text ({type(document).__name__})")
+
+    return documents, ids, metadatas
+
+def add_documents(collection, documents, ids, metadatas, embeddings=None):
+    """
+    Add documents to the collection in a single call. If the batch is
+    rejected, bisect it and retry each half so one bad record does not
+    sink the rest. Returns the ids that could not be added.
+    Without precomputed embeddings, Chroma embeds the documents itself.
+    """
+    if not documents:
+        return []
+    try:
+        collection.add(
+            documents=documents,
+            ids=ids,
+            metadatas=metadatas,
+            embeddings=embeddings
+        )
+        return []
+    except Exception as e:
+        if len(documents) == 1:
+            print(f"Error adding document {ids[0]}: {e}")
+            return list(ids)
+        mid = len(documents) // 2
+        halves = (embeddings[:mid], embeddings[mid:]) if embeddings is not None else (None, None)
+        return (add_documents(collection, documents[:mid], ids[:mid], metadatas[:mid], halves[0]) +
+                add_documents(collection, documents[mid:], ids[mid:], metadatas[mid:], halves[1]))
+
+def near_duplicate_keep(embeddings, threshold=NEAR_DUPLICATE_THRESHOLD, always_keep=()):
+    """
+    Return the indices of the documents to keep: each document is kept unless
+    its cosine similarity to an already kept one reaches the threshold.
+    Indices in always_keep (documents already stored) are kept regardless.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    # One matrix product gives every pairwise similarity in the batch
+    similarity = vectors @ vectors.T
+    always_keep = set(always_keep)
+    keep = []
+    for i in range(len(vectors)):
+        if i in always_keep or not keep or similarity[i, keep].max() < threshold:
+            keep.append(i)
+    return keep
+
+class BatchFlusher:
+    """
+    Buffer documents across politicians and add them to the collection in
+    batches of about max_batch documents; a file's documents always share a
+    batch. Documents whose ids are already in the collection are skipped.
+    With an embedder (see embedding_cache), each batch is embedded before
+    the add instead of inside Chroma, and near-duplicate documents of the
+    same politician and type are skipped.
+    """
+    def __init__(self, collection, max_batch=MAX_BATCH_SIZE, embedder=None):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.embedder = embedder
+        # Near-duplicates are looked for among all of a politician's documents,
+        # stored or not, so the same ones are skipped on every run; stored
+        # documents are compared by the vectors the probe reads back
+        self.dedupe = embedder is not None and NEAR_DUPLICATE_THRESHOLD is not None
+        self.probe_include = ["embeddings"] if self.dedupe else []
+        self.documents, self.ids, self.metadatas = [], [], []
+        self.added = 0
+        self.skipped = 0
+        self.existing = 0
+        self.failed_ids = []
+
+    def buffer(self, documents, ids, metadatas):
+        """Queue one politician's documents; returns True once a batch is full."""
+        self.documents.extend(documents)
+        self.ids.extend(ids)
+        self.metadatas.extend(metadatas)
+        return len(self.documents) >= self.max_batch
+
+    def extend(self, documents, ids, metadatas):
+        if self.buffer(documents, ids, metadatas):
+            self.flush()
+
+    def take_buffers(self):
+        """Empty the buffers and return their (documents, ids, metadatas)."""
+        batch = (self.documents, self.ids, self.metadatas)
+        self.documents, self.ids, self.metadatas = [], [], []
+        return batch
+
+    def prepare_batch(self, stored, documents, ids, metadatas):
+        """
+        Given the id probe for a batch, return the (documents, ids, metadatas,
+        embeddings) still to add. Stored documents are dropped without being
+        embedded; with an embedder the rest are embedded and near-duplicates
+        skipped.
+        """
+        existing_ids = set(stored["ids"])
+        new = [i for i, doc_id in enumerate(ids) if doc_id not in existing_ids]
+        self.existing += len(ids) - len(new)
+        embeddings = None
+        if new and self.embedder:
+            new_vectors = dict(zip(new, self.embedder.embed([documents[i] for i in new])))
+            if self.dedupe:
+                new = self.drop_near_duplicates(new, new_vectors, stored, ids, metadatas)
+            embeddings = [new_vectors[i] for i in new]
+        return ([documents[i] for i in new], [ids[i] for i in new],
+                [metadatas[i] for i in new], embeddings)
+
+    def drop_near_duplicates(self, new, new_vectors, stored, ids, metadatas):
+        """
+        Return the indices in new that are not near-duplicates. Documents are
+        compared only with others of the same politician and type, in file
+        order; stored ones keep their place and always count as kept, so a
+        re-run skips exactly what the first run skipped.
+        """
+        stored_vectors = dict(zip(stored["ids"], stored["embeddings"]))
+        groups = {}
+        for i, metadata in enumerate(metadatas):
+            if i in new_vectors or ids[i] in stored_vectors:
+                groups.setdefault((metadata["politician_id"], metadata["type"]), []).append(i)
+        keep = set()
+        for group in groups.values():
+            vectors = [new_vectors[i] if i in new_vectors else stored_vectors[ids[i]] for i in group]
+            stored_positions = [k for k, i in enumerate(group) if i not in new_vectors]
+            keep.update(group[k] for k in near_duplicate_keep(vectors, always_keep=stored_positions))
+        kept = [i for i in new if i in keep]
+        self.skipped += len(new) - len(kept)
+        return kept
+
+    def flush(self):
+        """Add any buffered documents to the collection."""
+        if not self.documents:
+            return
+        documents, ids, metadatas = self.take_buffers()
+        # One probe lets re-runs skip embedding and re-adding documents that
+        # are already stored
+        stored = self.collection.get(ids=ids, include=self.probe_include)
+        documents, ids, metadatas, embeddings = self.prepare_batch(stored, documents, ids, metadatas)
+        if not documents:
+            return
+        failed_ids = add_documents(self.collection, documents, ids, metadatas, embeddings)
+        self.added += len(documents) - len(failed_ids)
+        self.failed_ids.extend(failed_ids)
+
+async def add_documents_async(collection, documents, ids, metadatas, embeddings=None):
+    """Async counterpart of add_documents for collections from AsyncHttpClient."""
+    if not documents:
+        return []
+    try:
+        await collection.add(
+            documents=documents,
+            ids=ids,
+            metadatas=metadatas,
+            embeddings=embeddings
+        )
+        return []
+    except Exception as e:
+        if len(documents) == 1:
+            print(f"Error adding document {ids[0]}: {e}")
+            return list(ids)
+        mid = len(documents) // 2
+        halves = (embeddings[:mid], embeddings[mid:]) if embeddings is not None else (None, None)
+        return (await add_documents_async(collection, documents[:mid], ids[:mid], metadatas[:mid], halves[0]) +
+                await add_documents_async(collection, documents[mid:], ids[mid:], metadatas[mid:], halves[1]))
+
+class AsyncBatchFlusher(BatchFlusher):
+    """
+    BatchFlusher for a Chroma server: each full batch is sent as a background
+    task so reading the next files overlaps with earlier batches being
+    written. extend/flush are coroutines that wait while max_inflight
+    batches are pending, so at most that many batches are held in memory.
+    """
+    def __init__(self, collection, max_batch=MAX_BATCH_SIZE, embedder=None, max_inflight=MAX_INFLIGHT_ADDS):
+        super().__init__(collection, max_batch, embedder)
+        self.semaphore = asyncio.Semaphore(max_inflight)
+        self.tasks = set()
+        # Embedding runs off the event loop on one worker thread, which also
+        # keeps the cache's SQLite connection to a single thread at a time
+        self.embed_executor = ThreadPoolExecutor(max_workers=1)
+
+    async def extend(self, documents, ids, metadatas):
+        if self.buffer(documents, ids, metadatas):
+            await self.flush()
+
+    async def flush(self):
+        if not self.documents:
+            return
+        # Take a slot before queuing the batch; it is released when the
+        # batch has been added
+        await self.semaphore.acquire()
+        task = asyncio.ensure_future(self._add_batch(*self.take_buffers()))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _add_batch(self, documents, ids, metadatas):
+        try:
+            added, failed_ids = await self._store_batch(documents, ids, metadatas)
+        except Exception as e:
+            # Nothing awaits these tasks' results one by one, so a batch that
+            # fails outright (embedding, or the server rejecting the probe) is
+            # recorded here instead of being lost
+            print(f"Error adding a batch of {len(ids)} documents: {e}")
+            added, failed_ids = 0, list(ids)
+        finally:
+            self.semaphore.release()
+        self.added += added
+        self.failed_ids.extend(failed_ids)
+
+    async def _store_batch(self, documents, ids, metadatas):
+        """Probe, embed and add one batch; returns (added, failed_ids)."""
+        stored = await self.collection.get(ids=ids, include=self.probe_include)
+        loop = asyncio.get_running_loop()
+        documents, ids, metadatas, embeddings = await loop.run_in_executor(
+            self.embed_executor, self.prepare_batch, stored, documents, ids, metadatas
+        )
+        if not documents:
+            return 0, []
+        failed_ids = await add_documents_async(self.collection, documents, ids, metadatas, embeddings)
+        return len(documents) - len(failed_ids), failed_ids
+
+    async def wait(self):
+        """Flush the last partial batch and wait for every pending add."""
+        await self.flush()
+        await asyncio.gather(*self.tasks)
+        self.embed_executor.shutdown()
+
+def ingest_politician(entry: dict, collection):
+    """
+    Store each relevant piece of text as a separate document.
+    Returns the ids that could not be added.
+    """
+    documents, ids, metadatas = prepare_politician_docs(entry)
+
+    # A single add lets Chroma embed every document in one batch and write
+    # them in one transaction instead of one round-trip per document
+    return add_documents(collection, documents, ids, metadatas)
+
+def load_json_file(data_file):
+    """Parse a JSON file, mapping large files into memory rather than copying them."""
+    with open(data_file, "rb") as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return _loads(view)
+        return _loads(f.read())
+
+# Errors that make a single file fail without stopping the run: unreadable
+# files (OSError), invalid JSON (json/orjson JSONDecodeError are ValueErrors)
+# and malformed fields inside an otherwise valid object (TypeError/KeyError)
+FILE_ERRORS = (OSError, ValueError, TypeError, KeyError)
+
+def prepare_politician_file(data_file):
+    """
+    Load one politician JSON file and prepare its documents.
+    Returns None if the file is JSON but not a single politician object with
+    an "id", such as the Scrapy feed exports written to the same data/
+    directory. Raises one of FILE_ERRORS if the file cannot be used.
+    """
+    entry = load_json_file(data_file)
+    if not isinstance(entry, dict) or not entry.get("id"):
+        return None
+    return prepare_politician_docs(entry)
+
+def prepared_file_result(data_file, future):
+    """
+    Return (prepared, failed) for a finished prepare_politician_file future.
+    Files that are skipped or broken are reported and give prepared=None;
+    only broken ones set failed.
+    """
+    try:
+        prepared = future.result()
+    except FILE_ERRORS as e:
+        print(f"Error: could not ingest {data_file}: {e}")
+        return None, True
+    if prepared is None:
+        print(f"Skipping {data_file}: not a politician JSON object")
+    return prepared, False
+
+def iter_json_files(directory):
+    """Yield the paths of the *.json files directly inside a directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".json") and not name.startswith(".") and entry.is_file():
+                yield entry.path
+
+def find_data_files(paths):
+    """Expand directory arguments to the JSON files they contain."""
+    data_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            # Files are ingested in completion order, so no sort is needed
+            data_files.extend(iter_json_files(path))
+        else:
+            data_files.append(path)
+    return data_files
+
+def report_progress(done, total):
+    """Print how many files have been prepared, every PROGRESS_EVERY files and at the end."""
+    if done % PROGRESS_EVERY == 0 or done == total:
+        print(f"Prepared {done}/{total} files")
+
+def open_embedding_cache():
+    """Open the embedding cache, or return None to let Chroma embed documents itself."""
+    try:
+        return EmbeddingCache()
+    except Exception as e:
+        print(f"Warning: embedding cache unavailable, Chroma will embed documents: {e}")
+        return None
+
+def report_ingest_stats(cache, flusher):
+    if cache:
+        print(f"Embedding cache: {cache.hits} hits, {cache.misses} misses ({EMBED_CACHE_PATH})")
+        cache.close()
+    if flusher.existing:
+        print(f"Skipped {flusher.existing} documents already in the collection")
+    if flusher.skipped:
+        print(f"Skipped {flusher.skipped} near-duplicate documents")
+
+def ingest_files(data_files):
+    """
+    Ingest the files into the local persistent database.
+    Returns True if any file or document failed.
+    """
     # Get the client from the shared config
     client = get_chroma_client()
     
     # Create or get the collection - use get_or_create to ensure it exists
-    politicians_collection = client.get_or_create_collection("politicians")
-    
-    # Use command line argument if provided, otherwise use default
-    data_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DATA_FILE
-    
-    # Check if file exists
-    if not os.path.exists(data_file):
-        print(f"Error: Data file not found: {data_file}")
-        print(f"Current working directory: {os.getcwd()}")
-        print(f"Script directory: {SCRIPT_DIR}")
-        print(f"Project root: {PROJECT_ROOT}")
-        sys.exit(1)
+    politicians_collection = get_politicians_collection(client)
     
-    # Load data file
-    try:
-        with open(data_file, "r") as f:
-            entry = json.load(f)
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON format in {data_file}")
-        sys.exit(1)
+    # Read and prepare files in parallel; Chroma writes stay on this thread
+    # because its client is not guaranteed to be thread-safe
+    failed = False
+    embedding_cache = open_embedding_cache()
+    flusher = BatchFlusher(politicians_collection, embedder=embedding_cache)
+    max_workers = min(MAX_LOAD_WORKERS, len(data_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Ingest files as soon as they are ready rather than in argument order,
+        # so one large file does not hold up the ones behind it
+        futures = {executor.submit(prepare_politician_file, data_file): data_file
+                   for data_file in data_files}
+        for done, future in enumerate(as_completed(futures), 1):
+            data_file = futures[future]
+            report_progress(done, len(data_files))
+            prepared, file_failed = prepared_file_result(data_file, future)
+            failed = failed or file_failed
+            if prepared is None:
+                continue
+
+            # Queue for ingestion; documents from several files share each batch
+            flusher.extend(*prepared)
 
-    # Ingest into Chroma
-    ingest_politician(entry, politicians_collection)
+    # Ingest whatever is left in the last partial batch
+    flusher.flush()
+    print(f"Ingested {flusher.added} documents from {len(data_files)} file(s)")
+    report_ingest_stats(embedding_cache, flusher)
+    if flusher.failed_ids:
+        print(f"Error: {len(flusher.failed_ids)} documents could not be added: {', '.join(flusher.failed_ids)}")
+        failed = True
 
     # Data is automatically persisted when using persist_directory
-    print(f"Ingested data from {data_file} successfully!")
     print(f"Database location: {DB_DIR}")
     
     # Show the available collections after ingestion
     print_collections(client)
 
+    return failed
+
+async def ingest_files_async(data_files):
+    """
+    Ingest the files into the Chroma server at CHROMA_HOST.
+    Returns True if any file or document failed.
+    """
+    client = await get_async_chroma_client()
+    politicians_collection = await get_politicians_collection_async(client)
+    
+    failed = False
+    embedding_cache = open_embedding_cache()
+    flusher = AsyncBatchFlusher(politicians_collection, embedder=embedding_cache)
+    loop = asyncio.get_running_loop()
+    max_workers = min(MAX_LOAD_WORKERS, len(data_files))
+    # Only a few files are parsed ahead of the flusher, so a slow server does
+    # not leave the rest of the corpus waiting in memory
+    prepare_slots = asyncio.Semaphore(2 * max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        async def prepare(data_file):
+            await prepare_slots.acquire()
+            future = loop.run_in_executor(executor, prepare_politician_file, data_file)
+            # Errors are read from the future by the consumer, per file
+            await asyncio.wait([future])
+            return data_file, future
+
+        for done, next_prepared in enumerate(asyncio.as_completed([prepare(f) for f in data_files]), 1):
+            data_file, future = await next_prepared
+            report_progress(done, len(data_files))
+            try:
+                prepared, file_failed = prepared_file_result(data_file, future)
+                failed = failed or file_failed
+                if prepared is None:
+                    continue
+
+                await flusher.extend(*prepared)
+            finally:
+                prepare_slots.release()
+
+    await flusher.wait()
+    print(f"Ingested {flusher.added} documents from {len(data_files)} file(s)")
+    report_ingest_stats(embedding_cache, flusher)
+    if flusher.failed_ids:
+        print(f"Error: {len(flusher.failed_ids)} documents could not be added: {', '.join(flusher.failed_ids)}")
+        failed = True
+
+    print(f"Chroma server: {CHROMA_HOST}:{CHROMA_PORT}")
+    return failed
+
+def main(files=None):
+    """
+    Ingest the given files/directories. Without arguments, use the command
+    line, falling back to the sample file; a driver script can pass its own
+    list instead of spawning one process per file.
+    """
+    if files is None:
+        files = sys.argv[1:]
+    data_files = find_data_files(files or [DEFAULT_DATA_FILE])
+    
+    # Check if files exist
+    missing_files = [f for f in data_files if not os.path.exists(f)]
+    if missing_files or not data_files:
+        for data_file in missing_files:
+            print(f"Error: Data file not found: {data_file}")
+        if not data_files:
+            print("Error: No data files found")
+        print(f"Current working directory: {os.getcwd()}")
+        print(f"Script directory: {SCRIPT_DIR}")
+        print(f"Project root: {PROJECT_ROOT}")
+        sys.exit(1)
+    
+    # With a Chroma server configured, overlap file reads with in-flight adds
+    if CHROMA_HOST:
+        failed = asyncio.run(ingest_files_async(data_files))
+    else:
+        failed = ingest_files(data_files)
+
+    if failed:
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,29 @@
 # scripts/query_data.py
 import sys
 from chromadb.errors import NotFoundError
-from chroma_config import get_chroma_client, print_collections, DB_DIR
+from chroma_config import get_chroma_client, get_politicians_collection, print_collections, DB_DIR, COLLECTION_NAME
+from embedding_cache import EmbeddingCache
+
+QUERY_TEXT = "What did John Doe say about healthcare?"
+
+# Only fetch the fields that are printed; add "distances" to see match scores
+QUERY_INCLUDE = ["documents", "metadatas"]
+
+def embed_query(text):
+    """
+    Embed the query through the shared embedding cache, so repeating a query
+    does not load and run the model again. Returns None if the cache is
+    unavailable, in which case Chroma embeds the query text itself.
+    """
+    try:
+        cache = EmbeddingCache()
+    except Exception as e:
+        print(f"Warning: embedding cache unavailable: {e}")
+        return None
+    try:
+        return cache.embed([text])
+    finally:
+        cache.close()
 
 def main():
     # Get the client from the shared config
@@ -9,15 +31,24 @@ def main():
     
     try:
         # Try to get the collection
-        collection = client.get_collection("politicians")
+        collection = client.get_collection(COLLECTION_NAME)
         
         # Example: retrieve the top 3 docs most relevant to a question about healthcare
-        results = collection.query(
-            query_texts=["What did John Doe say about healthcare?"],
-            n_results=3
-        )
+        query_embeddings = embed_query(QUERY_TEXT)
+        if query_embeddings is not None:
+            results = collection.query(
+                query_embeddings=query_embeddings,
+                n_results=3,
+                include=QUERY_INCLUDE
+            )
+        else:
+            results = collection.query(
+                query_texts=[QUERY_TEXT],
+                n_results=3,
+                include=QUERY_INCLUDE
+            )
         
-        # The result is a dict with keys: 'ids', 'embeddings', 'metadatas', 'documents'
+        # The result is a dict with keys: 'ids', 'metadatas', 'documents'
         print("Query Results:\n", results)
     
     except NotFoundError:
@@ -33,7 +64,7 @@ def main():
         # Try to recreate the collection as a fallback
         print("\nAttempting to create the collection as a fallback...")
         try:
-            politicians_collection = client.create_collection("politicians")
+            politicians_collection = get_politicians_collection(client)
             print("Created empty 'politicians' collection. Please run ingest_data.py to add data.")
         except Exception as e:
             print(f"Failed to create collection: {e}")
@@ -1,26 +1,35 @@
 # scripts/setup_chroma.py
 
-from chroma_config import get_chroma_client, print_collections, DB_DIR
+import argparse
+from chroma_config import get_chroma_client, get_politicians_collection, print_collections, DB_DIR
 
 def main():
+    parser = argparse.ArgumentParser(description='Set up the Chroma database')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Add a test doc and list the collections after setup')
+    args = parser.parse_args()
+    
     # Get the client from the shared config
     client = get_chroma_client()
     
     # Create or get the collection
-    politicians_collection = client.get_or_create_collection("politicians")
-    
-    # Add a test doc (optional)
-    politicians_collection.add(
-        documents=["This is a test doc for John Doe."],
-        ids=["test_john_doe_001"],
-        metadatas=[{"politician_id": "john-doe-123"}]
-    )
+    politicians_collection = get_politicians_collection(client)
     
-    print("Chroma setup complete. Test doc added.")
+    if args.verbose:
+        # Add a test doc (optional)
+        politicians_collection.add(
+            documents=["This is a test doc for John Doe."],
+            ids=["test_john_doe_001"],
+            metadatas=[{"politician_id": "john-doe-123"}]
+        )
+        print("Chroma setup complete. Test doc added.")
+    else:
+        print("Chroma setup complete.")
     print(f"Database location: {DB_DIR}")
     
     # List available collections
-    print_collections(client)
+    if args.verbose:
+        print_collections(client)
 
 if __name__ == "__main__":
     main()